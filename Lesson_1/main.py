@@ -33,7 +33,9 @@ class TextSummarizationModel():
         
     def __init__(self, name: str, version: str, cost_per_request: float,
                  max_input_length: int, supported_languages: List[str]):
-        super().__init__(name, version, cost_per_request)
+        self._name = name
+        self._version = version
+        self._cost_per_request = cost_per_request
         self._max_input_length = max_input_length
         self._supported_languages = supported_languages
 